@@ -7,10 +7,11 @@ import argparse
 import os
 from pathlib import Path
 import pickle
-import tempfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import multiprocessing
+from multiprocessing import shared_memory
 import time
+import threading
 import signal
 import sys
 import atexit
@@ -20,18 +21,21 @@ BATCH_SIZE = 1_000_000
 MAX_EDGE_FILE_LINES = 20_000_000
 CSV_BUFFER_SIZE = 8 * 1024 * 1024
 executor = None
-_AUX_PATH = None
+aux_shm = None
 
 def cleanup():
     """Cleanup function to handle shared resources."""
-    global executor
+    global executor, aux_shm
     if executor is not None:
         print("\nShutting down workers...", file=sys.stderr)
         executor.shutdown(wait=False)
-    try:
-        os.remove(_AUX_PATH)
-    except OSError:
-        pass
+    if aux_shm is not None:
+        try:
+            aux_shm.close()
+            aux_shm.unlink()
+        except Exception:
+            pass
+        aux_shm = None
 
 
 def signal_handler(signum, frame):
@@ -51,33 +55,66 @@ def get_human_size(size_bytes):
     return f"{size_bytes:.2f} PB"
 
 
-def get_total_file_size(available_disks=None, out_dir=None):
-    """Calculate total size of all generated files."""
+def _dir_file_size(dir_path):
+    """Sum size and count of the CSV files in each label folder under dir_path."""
     total_size = 0
     files_count = 0
+    if os.path.exists(dir_path):
+        with os.scandir(dir_path) as folders:
+            for folder in folders:
+                if not folder.is_dir():
+                    continue
+                with os.scandir(folder.path) as files:
+                    for entry in files:
+                        if entry.name.endswith('.csv'):
+                            total_size += entry.stat().st_size
+                            files_count += 1
+    return total_size, files_count
 
-    def process_dir(dir_path):
-        nonlocal total_size, files_count
-        if os.path.exists(dir_path):
-            for fold_name in os.listdir(dir_path):
-                folder_path = os.path.join(dir_path, fold_name)
-                for file in os.listdir(folder_path):
-                    if file.endswith('.csv'):
-                        path = os.path.join(folder_path, file)
-                        total_size += os.path.getsize(path)
-                        files_count += 1
-    
+
+def get_total_file_size(available_disks=None, out_dir=None):
+    """Calculate total size of all generated files, scanning each disk in parallel."""
     if out_dir:
-        process_dir(os.path.join(out_dir, "vertices"))
-        process_dir(os.path.join(out_dir, "edges"))
+        dirs = [os.path.join(out_dir, "vertices"), os.path.join(out_dir, "edges")]
     else:
-        for disk in available_disks:
-            process_dir(f"/mnt/data{disk}/vertices")
-            process_dir(f"/mnt/data{disk}/edges")
-    
+        dirs = [f"/mnt/data{disk}/{kind}" for disk in available_disks for kind in ("vertices", "edges")]
+
+    with ThreadPoolExecutor(max_workers=len(dirs)) as pool:
+        results = list(pool.map(_dir_file_size, dirs))
+
+    total_size = sum(size for size, _ in results)
+    files_count = sum(count for _, count in results)
     return total_size, files_count
 
 
+def reset_output_dir(out_dir):
+    """
+    Give the run an empty output directory.
+    A previous run's output is renamed aside and that path is returned, so the caller can delete it
+    in the background instead of waiting on removing millions of files. Returns None when nothing is left to delete.
+    """
+    out_dir = os.path.normpath(os.path.abspath(out_dir))
+    old_dir = None
+    if os.path.exists(out_dir):
+        cwd = os.getcwd()
+        try:
+            if os.path.ismount(out_dir) or cwd == out_dir or cwd.startswith(out_dir + os.sep):
+                raise OSError(f"{out_dir} cannot be moved aside")
+            old_dir = f"{out_dir}.old-{time.time_ns()}"
+            os.rename(out_dir, old_dir)
+        except OSError:
+            # mount points, the working directory and cross-device paths are cleared in place instead
+            old_dir = None
+            with os.scandir(out_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.remove(entry.path)
+    os.makedirs(out_dir, exist_ok=True)
+    return old_dir
+
+
 def sample_targets(n, u, k, rng):
     targets = set()
     while len(targets) < k:
@@ -93,17 +130,15 @@ def sample_lognormal_degree(rng, median: float, sigma: float, cap: int = 1_000_0
     return int(min(cap, round(x)))
 
 
-def dump_pickle(obj, path=None):
+def share_pickle(obj) -> shared_memory.SharedMemory:
     """
-    Serialize object to disk using pickle.
-    If no path use a secure temp file and return its path.
+    Serialize object with pickle into a new shared memory block.
+    Workers attach by name instead of re-reading a temp file from disk.
     """
-    if path is None:
-        fd, path = tempfile.mkstemp(suffix=".pkl", prefix="aux_payload_")
-        os.close(fd)
-    with open(path, "wb") as f:
-        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
-    return path
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(payload)))
+    shm.buf[:len(payload)] = payload
+    return shm
 
 
 def partition_even(total: int, parts: int):
@@ -121,11 +156,11 @@ def partition_even(total: int, parts: int):
         start += cnt
     return partitions
 
-def _run_chunk(worker_slot, *, aux_path, seed, ego_start, ego_count, total_disks, out_dir,
+def _run_chunk(worker_slot, *, aux_shm_name, seed, ego_start, ego_count, total_disks, out_dir,
                node_share_chance, num_workers, invert_direction):
     verts, edges = gen.process_full_worker(
         worker_id=worker_slot,
-        aux_path=aux_path,
+        aux_shm_name=aux_shm_name,
         seed=seed,
         ego_start=ego_start,
         ego_count=ego_count,
@@ -156,7 +191,7 @@ def partition_chunks(num_egos: int, target_chunks: int, chunk_size: int) -> List
 
 
 def main():
-    global executor
+    global executor, aux_shm
     
     # Register cleanup handlers
     atexit.register(cleanup)
@@ -208,6 +243,7 @@ def main():
         # Handle output location
         available_disks = None
         out_dir = None
+        stale_dir = None
         if args.mount:
             available_disks = [i for i in range(1, 25) if os.path.ismount(f"/mnt/data{i}")]
             if not available_disks:
@@ -215,15 +251,12 @@ def main():
             print(f"\nFound {len(available_disks)} mounted disks: {', '.join(f'/mnt/data{i}' for i in available_disks)}")
         else:
             if args.out_dir is not None:
-                os.makedirs(args.out_dir, exist_ok=True)
                 out_dir = args.out_dir
-                print(f"\nOutput directory: {args.out_dir}")
             else:
                 out_dir = base_dir / "output"
-                out_dir.mkdir(parents=True, exist_ok=True)
-                print(f"\nOutput directory: {out_dir}")
-            if os.path.exists(out_dir):
-                shutil.rmtree(out_dir)
+            out_dir = os.path.normpath(os.path.abspath(out_dir))
+            stale_dir = reset_output_dir(out_dir)
+            print(f"\nOutput directory: {out_dir}")
 
         # Optimize worker count
         cpu_count = multiprocessing.cpu_count()
@@ -245,7 +278,7 @@ def main():
             "edge_properties": edge_prop_map,
             "vertex_properties": vert_prop_map
         }
-        _AUX_PATH = dump_pickle(aux_payload)
+        aux_shm = share_pickle(aux_payload)
 
         chunks = partition_chunks(num_egos, args.target_chunks, args.chunk_size)
         total_chunks = len(chunks)
@@ -259,12 +292,11 @@ def main():
 
             future_to_chunk = {}
             for idx, (ego_start, ego_count) in enumerate(chunks):
-                worker_slot = idx % workers  # spreads any worker-id-based routing deterministically
                 future = executor.submit(
                     _run_chunk,
                     idx,
-                    aux_path=_AUX_PATH,
-                    seed=np.random.default_rng(args.seed + worker_slot),
+                    aux_shm_name=aux_shm.name,
+                    seed=args.seed,
                     ego_start=ego_start,
                     ego_count=ego_count,
                     total_disks=total_disks,
@@ -275,6 +307,11 @@ def main():
                 )
                 future_to_chunk[future] = (ego_start, ego_count)
 
+            # Delete the previous run's output only once every task is submitted: the pool forks its
+            # workers during submit, and forking while another thread runs is unsafe (warned on 3.12+).
+            if stale_dir is not None:
+                threading.Thread(target=shutil.rmtree, args=(stale_dir,), kwargs={"ignore_errors": True}).start()
+
             # Progress bar updates when each chunk finishes
             with tqdm(total=num_egos, unit="ego", smoothing=0.05, dynamic_ncols=True) as pbar:
                 completed_chunks = 0
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 import ast, random
 from typing import Tuple, Any, List, Dict, Iterator, Optional
 from faker import Faker
+import numpy as np
 from datetime import date
 import math, sys
 
@@ -17,13 +18,16 @@ DOUBLE_MIN, DOUBLE_MAX = -sys.float_info.max, sys.float_info.max
 
 def _is_iso_date_string(s: str) -> bool:
     # strict date-only check (YYYY-MM-DD)
+    # reject by shape first so malformed values never reach the exception path
+    if len(s) < 10 or s[4] != "-" or s[7] != "-":
+        return False
+    if len(s) > 10 and not s[10:].isspace():
+        return False
     try:
-        if len(s) < 10:
-            return False
         date.fromisoformat(s[:10])
-        return len(s) == 10 or s[10:].strip() == ""
-    except Exception:
+    except ValueError:
         return False
+    return True
 
 
 def _sample_values(method: str,
@@ -38,11 +42,10 @@ def _sample_values(method: str,
     """
     out: List[Any] = []
     if pool:
-        k = min(n_checks, len(pool))
-        if k <= len(pool):
-            out.extend(random.sample(pool, k))
-        else:
-            out.extend(pool[:])
+        if len(pool) >= n_checks:
+            # pools are shuffled on creation, so any slice is a fair sample
+            return pool[:n_checks]
+        out.extend(pool)
     need = n_checks - len(out)
     if need > 0 and fake is not None:
         meth = getattr(fake, method, None)
@@ -52,8 +55,17 @@ def _sample_values(method: str,
     return out
 
 
-def validate_faker_int(method: str, args: List[Any], kwargs: Dict[str, Any],
-                       fake: Optional[Faker], pool: Optional[List[Any]]):
+def _first_out_of_range(samples: List[Any], lo, hi) -> Optional[int]:
+    """
+    Range-check numeric samples with one min()/max() pass.
+    Only when that fails, walk the samples to find the offending index.
+    """
+    if not samples or (min(samples) >= lo and max(samples) <= hi):
+        return None
+    return next((i for i, v in enumerate(samples) if v < lo or v > hi), None)
+
+
+def validate_faker_int(method: str, kwargs: Dict[str, Any], samples: List[Any]):
     max_value = kwargs.get("max_value")
     min_value = kwargs.get("min_value")
     if max_value:
@@ -67,15 +79,15 @@ def validate_faker_int(method: str, args: List[Any], kwargs: Dict[str, Any],
         if min_value > INT_MAX:
             raise ValueError(f"Min value of int method {method} is out of bounds (greater then {INT_MAX})")
 
-    for i, v in enumerate(_sample_values(method, args, kwargs, fake, pool)):
-        if not isinstance(v, int) or isinstance(v, bool):
+    for i, v in enumerate(samples):
+        if type(v) is not int:
             raise TypeError(f"[{i}] expected int, got {_type_name(v)}: {v!r}")
-        if v < INT_MIN or v > INT_MAX:
-            raise ValueError(f"[{i}] int of method {method} out of 32-bit range: {v}")
+    i = _first_out_of_range(samples, INT_MIN, INT_MAX)
+    if i is not None:
+        raise ValueError(f"[{i}] int of method {method} out of 32-bit range: {samples[i]}")
 
 
-def validate_faker_long(method: str, args: List[Any], kwargs: Dict[str, Any],
-                        fake: Optional[Faker], pool: Optional[List[Any]]):
+def validate_faker_long(method: str, kwargs: Dict[str, Any], samples: List[Any]):
     max_value = kwargs.get("max_value")
     min_value = kwargs.get("min_value")
     if max_value:
@@ -89,15 +101,15 @@ def validate_faker_long(method: str, args: List[Any], kwargs: Dict[str, Any],
         if min_value > LONG_MAX:
             raise ValueError(f"Min value of int method {method} is out of bounds (greater then {LONG_MAX})")
 
-    for i, v in enumerate(_sample_values(method, args, kwargs, fake, pool)):
-        if not isinstance(v, int) or isinstance(v, bool):
+    for i, v in enumerate(samples):
+        if type(v) is not int:
             raise TypeError(f"[{i}] expected long (int) from method {method}, got {_type_name(v)}: {v!r}")
-        if v < LONG_MIN or v > LONG_MAX:
-            raise ValueError(f"[{i}] long from method {method} out of 64-bit range: {v}")
+    i = _first_out_of_range(samples, LONG_MIN, LONG_MAX)
+    if i is not None:
+        raise ValueError(f"[{i}] long from method {method} out of 64-bit range: {samples[i]}")
 
 
-def validate_faker_double(method: str, args: List[Any], kwargs: Dict[str, Any],
-                          fake: Optional[Faker], pool: Optional[List[Any]]):
+def validate_faker_double(method: str, kwargs: Dict[str, Any], samples: List[Any]):
     max_value = kwargs.get("max_value")
     min_value = kwargs.get("min_value")
     if max_value:
@@ -111,44 +123,52 @@ def validate_faker_double(method: str, args: List[Any], kwargs: Dict[str, Any],
         if min_value > DOUBLE_MAX:
             raise ValueError(f"Min value of int method {method} is out of bounds (greater then {DOUBLE_MAX})")
 
-    for i, v in enumerate(_sample_values(method, args, kwargs, fake, pool)):
-        if not (isinstance(v, (int, float)) and not isinstance(v, bool)):
+    for i, v in enumerate(samples):
+        t = type(v)
+        if t is not float and t is not int:
             raise TypeError(f"[{i}] expected float from method {method}, got {_type_name(v)}: {v!r}")
-        fv = float(v)
-        if math.isnan(fv) or math.isinf(fv):
-            raise ValueError(f"[{i}] float must be finite (no NaN/Inf); got {fv!r} from method {method}")
-        if fv < DOUBLE_MIN or fv > DOUBLE_MAX:
-            raise ValueError(f"[{i}] float from method {method} out of bounds: {fv!r}")
+    if not all(map(math.isfinite, samples)):
+        i = next(i for i, v in enumerate(samples) if not math.isfinite(v))
+        raise ValueError(f"[{i}] float must be finite (no NaN/Inf); got {float(samples[i])!r} from method {method}")
+    i = _first_out_of_range(samples, DOUBLE_MIN, DOUBLE_MAX)
+    if i is not None:
+        raise ValueError(f"[{i}] float from method {method} out of bounds: {samples[i]!r}")
 
 
-def validate_faker_date(method: str, args: List[Any], kwargs: Dict[str, Any],
-                        fake: Optional[Faker], pool: Optional[List[Any]]):
-    for i, v in enumerate(_sample_values(method, args, kwargs, fake, pool)):
-        if not isinstance(v, str):
+def validate_faker_date(method: str, kwargs: Dict[str, Any], samples: List[Any]):
+    for i, v in enumerate(samples):
+        if type(v) is not str:
             raise TypeError(f"[{i}] expected ISO date string from method {method}, got {_type_name(v)}: {v!r}")
         if not _is_iso_date_string(v):
             raise ValueError(f"[{i}] not ISO date (YYYY-MM-DD) from method {method}: {v!r}")
 
 
-def validate_faker_list(method: str, args: List[Any], kwargs: Dict[str, Any],
-                        fake: Optional[Faker], pool: Optional[List[Any]]):
-    for i, v in enumerate(_sample_values(method, args, kwargs, fake, pool)):
-        if not isinstance(v, list):
+def _scalar_type(x):
+    t = type(x)
+    if t is str or t is int or t is float or t is bool:
+        return t
+    if isinstance(x, (list, tuple, dict, set)):
+        return None
+    if isinstance(x, bool): return bool
+    if isinstance(x, int):  return int
+    if isinstance(x, float):return float
+    if isinstance(x, str):  return str
+    return t
+
+
+def validate_faker_list(method: str, kwargs: Dict[str, Any], samples: List[Any]):
+    for i, v in enumerate(samples):
+        if type(v) is not list:
             raise TypeError(f"[{i}] expected list from method {method}, got {_type_name(v)}: {v!r}")
         if not v:
             continue
-        def _scalar_type(x):
-            if isinstance(x, (list, tuple, dict, set)):
-                return None
-            if isinstance(x, bool): return bool
-            if isinstance(x, int):  return int
-            if isinstance(x, float):return float
-            if isinstance(x, str):  return str
-            return type(x)
+        first = type(v[0])
         t0 = _scalar_type(v[0])
         if t0 is None:
             raise ValueError(f"[{i}] nested containers are not allowed; got {_type_name(v[0])} at index 0 from method {method}")
         for j, elt in enumerate(v[1:], start=1):
+            if type(elt) is first:
+                continue
             tj = _scalar_type(elt)
             if tj is None:
                 raise ValueError(f"[{i}] nested containers are not allowed; got {_type_name(elt)} at index {j} from method {method}")
@@ -160,19 +180,20 @@ def validate_faker_output(expected_kind: str,
                           method: str, args: List[Any], kwargs: Dict[str, Any],
                           fake: Optional[Faker], pool: Optional[List[Any]]):
     k = expected_kind.lower()
-    if k == "int":    return validate_faker_int(method, args, kwargs, fake, pool)
-    if k == "long":   return validate_faker_long(method, args, kwargs, fake, pool)
-    if k == "double": return validate_faker_double(method, args, kwargs, fake, pool)
-    if k == "date":   return validate_faker_date(method, args, kwargs, fake, pool)
-    if k == "list":   return validate_faker_list(method, args, kwargs, fake, pool)
+    samples = _sample_values(method, args, kwargs, fake, pool)
+    if k == "int":    return validate_faker_int(method, kwargs, samples)
+    if k == "long":   return validate_faker_long(method, kwargs, samples)
+    if k == "double": return validate_faker_double(method, kwargs, samples)
+    if k == "date":   return validate_faker_date(method, kwargs, samples)
+    if k == "list":   return validate_faker_list(method, kwargs, samples)
     if k == "string":
-        for i, v in enumerate(_sample_values(method, args, kwargs, fake, pool)):
-            if not isinstance(v, str):
+        for i, v in enumerate(samples):
+            if type(v) is not str:
                 raise TypeError(f"[{i}] expected string, got {_type_name(v)}: {v!r} from method {method}")
         return
     if k == "bool":
-        for i, v in enumerate(_sample_values(method, args, kwargs, fake, pool)):
-            if not isinstance(v, bool):
+        for i, v in enumerate(samples):
+            if type(v) is not bool:
                 raise TypeError(f"[{i}] expected bool, got {_type_name(v)}: {v!r} from method {method}")
         return
     raise ValueError(f"Unsupported property type: {expected_kind!r} from method {method}")
@@ -234,12 +255,25 @@ def _parse_faker_call(call_str: str, predicted_type : str) -> Tuple[str, List[An
     return method, args, kwargs
 
 
+def _numpy_int_range(method: str, args: tuple, kwargs: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """
+    Return (min_value, max_value) when the call is a plain bounded pyint that numpy can draw in bulk,
+    otherwise None so the caller keeps using Faker.
+    """
+    if method != "pyint" or args or not set(kwargs) <= {"min_value", "max_value"}:
+        return None
+    lo, hi = kwargs.get("min_value", 0), kwargs.get("max_value", 9999)
+    if type(lo) is not int or type(hi) is not int or not LONG_MIN <= lo <= hi <= LONG_MAX:
+        return None
+    return lo, hi
+
+
 def _type_name(x: Any) -> str:
     m, n = x.__class__.__module__, x.__class__.__qualname__
     return n if m == "builtins" else f"{m}.{n}"
 
 """Class that optimizes and handles property generation using Faker Generators"""
-@dataclass
+@dataclass(slots=True)
 class FakerSource:
     call_str: str
     locale: str = "en_US"
@@ -247,16 +281,18 @@ class FakerSource:
     batch_size: int = 1024
     pool_size: int = 0
     predicted_type: str=""
-    prefer_unique: bool = False
     _method_name: str = field(init=False, repr=False)
     _args: tuple = field(init=False, repr=False)
     _kwargs: dict = field(init=False, repr=False)
     _fake: Faker = field(init=False, repr=False)
     _method: Any = field(init=False, repr=False)   # bound provider method
     _buf: list = field(default_factory=list, repr=False)
+    _buf_idx: int = field(default=0, repr=False)
     _pool: Optional[List[Any]] = field(default=None, repr=False)
     _pool_idx: int = field(default=0, repr=False)
     _rng_state: Any = field(default=None, repr=False)
+    _int_range: Optional[Tuple[int, int]] = field(default=None, repr=False)
+    _np_rng: Any = field(default=None, repr=False)
     def __post_init__(self):
         self._method_name, args, kwargs = _parse_faker_call(self.call_str, self.predicted_type)
         self._args, self._kwargs = tuple(args), dict(kwargs)
@@ -269,19 +305,33 @@ class FakerSource:
         if self._method is None or not callable(self._method):
             raise ValueError(f"Faker has no method '{self._method_name}'")
 
+        self._int_range = _numpy_int_range(self._method_name, self._args, self._kwargs)
+        if self._int_range is not None:
+            self._np_rng = np.random.default_rng(self.seed)
+
         if self.pool_size > 0:
-            self._pool = [self._method(*self._args, **self._kwargs) for _ in range(self.pool_size)]
+            self._pool = self._draw(self.pool_size)
             random.Random(self.seed).shuffle(self._pool)  # deterministic order
+        else:
+            self._refill()
 
-        validate_faker_output(self.predicted_type, self._method_name, list(self._args), self._kwargs, self._fake, self._pool)
+        # validate values that were already drawn; fake=None so validation never calls Faker again
+        drawn = self._pool if self._pool is not None else self._buf
+        validate_faker_output(self.predicted_type, self._method_name, list(self._args), self._kwargs, None, drawn)
 
 
-    def _refill(self):
-        n = self.batch_size
+    def _draw(self, n: int) -> List[Any]:
+        if self._int_range is not None:
+            lo, hi = self._int_range
+            return self._np_rng.integers(lo, hi, size=n, endpoint=True).tolist()
         m = self._method
         a, kw = self._args, self._kwargs
-        out = self._buf
-        out.extend(m(*a, **kw) for _ in range(n))
+        return [m(*a, **kw) for _ in range(n)]
+
+
+    def _refill(self):
+        self._buf = self._draw(self.batch_size)
+        self._buf_idx = 0
 
 
     def _next_value(self):
@@ -292,9 +342,34 @@ class FakerSource:
                 self._pool_idx = 0
             return v
 
-        if not self._buf and self.prefer_unique:
+        if self._buf_idx == len(self._buf):
             self._refill()
-        return self._buf.pop()
+        v = self._buf[self._buf_idx]
+        self._buf_idx += 1
+        return v
+
+
+    def batch(self, n: int) -> List[Any]:
+        """Next n values, in the same order n single draws would return them"""
+        out: List[Any] = []
+        if self._pool is not None:
+            pool, i = self._pool, self._pool_idx
+            while len(out) < n:
+                take = min(n - len(out), len(pool) - i)
+                out.extend(pool[i:i + take])
+                i += take
+                if i == len(pool):
+                    i = 0
+            self._pool_idx = i
+            return out
+
+        while len(out) < n:
+            if self._buf_idx == len(self._buf):
+                self._refill()
+            take = min(n - len(out), len(self._buf) - self._buf_idx)
+            out.extend(self._buf[self._buf_idx:self._buf_idx + take])
+            self._buf_idx += take
+        return out
 
 
     def __call__(self) -> Any:
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from functools import partial
-from typing import Tuple, Any, List, Dict, Iterator, Optional, Callable
+from typing import Tuple, Any, List, Dict, Iterator, Optional
+import math
 import numpy as np
 import yaml
 
@@ -17,51 +17,84 @@ def validate_aerospike_properties(properties):
         gen = props.get("generator")
         ptype = props.get("type")
         pool_size = props.get("pool_size") or 20
-        unique_flag = props.get("prefer_unique") or False
         if not gen:
             raise ValueError(f"Invalid property definition '{prop_name}': property generator is empty.")
-        src = FakerSource(gen, pool_size=pool_size, batch_size=4096, prefer_unique=unique_flag, predicted_type=ptype)
+        src = FakerSource(gen, pool_size=pool_size, batch_size=4096, predicted_type=ptype)
         if not ptype:
             raise ValueError(f"Invalid property definition '{ptype}': property type is empty.")
         props["generator"] = src
 
 
-def _round_clip(x: float, round_mode: str, min_v: int | None, max_v: int | None) -> int:
-    if round_mode == "floor":
-        iv = int(np.floor(x))
-    elif round_mode == "ceil":
-        iv = int(np.ceil(x))
-    else:
-        iv = int(np.round(x))
-    if min_v is not None:
-        iv = max(int(min_v), iv)
-    if max_v is not None:
-        iv = min(int(max_v), iv)
-    return iv
+ROUND_NEAREST, ROUND_FLOOR, ROUND_CEIL = 0, 1, 2
+_ROUND_CODES = {"round": ROUND_NEAREST, "floor": ROUND_FLOOR, "ceil": ROUND_CEIL}
+DIST_FIXED, DIST_UNIFORM, DIST_NORMAL, DIST_POISSON, DIST_LOGNORMAL = 0, 1, 2, 3, 4
 
-def _deg_fixed(rng: np.random.Generator, value: float, round_mode: str, min_v: int | None, max_v: int | None) -> int:
-    return _round_clip(value, round_mode, min_v, max_v)
 
-def _deg_uniform(rng: np.random.Generator, low: float, high: float,
-                 round_mode: str, min_v: int | None, max_v: int | None) -> int:
-    return _round_clip(rng.uniform(low, high), round_mode, min_v, max_v)
+def _round_clip(x: float, round_code: int, min_v: int | None, max_v: int | None) -> int:
+    # math.floor/ceil and round() on a plain float return an int directly; np.floor/ceil/round on a scalar
+    # go through ufunc dispatch
+    if round_code == ROUND_FLOOR:
+        iv = math.floor(x)
+    elif round_code == ROUND_CEIL:
+        iv = math.ceil(x)
+    else:
+        iv = round(float(x))
+    if min_v is not None and iv < min_v:
+        iv = min_v
+    if max_v is not None and iv > max_v:
+        iv = max_v
+    return iv
 
-def _deg_normal(rng: np.random.Generator, mean: float, sigma: float,
-                round_mode: str, min_v: int | None, max_v: int | None) -> int:
-    return _round_clip(rng.normal(mean, sigma), round_mode, min_v, max_v)
+def _round_clip_batch(x: np.ndarray, round_code: int, min_v: int | None, max_v: int | None) -> np.ndarray:
+    """Vectorized _round_clip over an array of draws."""
+    if round_code == ROUND_FLOOR:
+        iv = np.floor(x)
+    elif round_code == ROUND_CEIL:
+        iv = np.ceil(x)
+    else:
+        iv = np.rint(x)
+    if min_v is not None or max_v is not None:
+        iv = np.clip(iv, min_v, max_v)
+    return iv.astype(np.int64)
 
-def _deg_poisson(rng: np.random.Generator, lam: float,
-                 round_mode: str, min_v: int | None, max_v: int | None) -> int:
-    return _round_clip(float(rng.poisson(lam)), round_mode, min_v, max_v)
 
-def _deg_lognormal(rng: np.random.Generator, meanlog: float, sigma: float,
-                   round_mode: str, min_v: int | None, max_v: int | None) -> int:
-    return _round_clip(rng.lognormal(mean=meanlog, sigma=sigma), round_mode, min_v, max_v)
+class _DegSampler:
+    """
+    Degree sampler built by parse_degree.
+    dist and round mode are stored as int codes, so a call is an attribute read and an int compare
+    instead of a partial unpacking its keyword arguments.
+    """
+    __slots__ = ("kind", "a", "b", "round_code", "min_v", "max_v")
+
+    def __init__(self, kind: int, a: float, b: float, round_code: int, min_v: int | None, max_v: int | None):
+        self.kind = kind
+        self.a = a
+        self.b = b
+        self.round_code = round_code
+        self.min_v = None if min_v is None else int(min_v)
+        self.max_v = None if max_v is None else int(max_v)
+
+    def __call__(self, rng: np.random.Generator, size: int | None = None):
+        k = self.kind
+        if k == DIST_FIXED:
+            x = self.a if size is None else np.full(size, self.a)
+        elif k == DIST_UNIFORM:
+            x = rng.uniform(self.a, self.b, size)
+        elif k == DIST_NORMAL:
+            x = rng.normal(self.a, self.b, size)
+        elif k == DIST_POISSON:
+            x = rng.poisson(self.a, size)
+        else:
+            x = rng.lognormal(self.a, self.b, size)
+        if size is None:
+            return _round_clip(x, self.round_code, self.min_v, self.max_v)
+        return _round_clip_batch(x, self.round_code, self.min_v, self.max_v)
 
 
-def parse_degree(param: Dict[str, Any]) -> Callable[[np.random.Generator], int]:
+def parse_degree(param: Dict[str, Any]) -> _DegSampler:
     """
-    Validate/normalize a degree spec and return a picklable callable
+    Validate/normalize a degree spec and return a picklable callable.
+    Call it as deg(rng) for one degree or deg(rng, size=n) for an int64 array of n degrees.
     """
     if not isinstance(param, dict):
         raise TypeError("degree must be a dict")
@@ -71,16 +104,16 @@ def parse_degree(param: Dict[str, Any]) -> Callable[[np.random.Generator], int]:
     min_v = param.get("min", 0)
     max_v = param.get("max", None)
 
-    if round_mode not in {"round", "floor", "ceil"}:
+    if round_mode not in _ROUND_CODES:
         raise ValueError(f"degree.round must be one of round|floor|ceil, got {round_mode}")
+    round_code = _ROUND_CODES[round_mode]
     if max_v is not None and min_v is not None and int(max_v) < int(min_v):
         raise ValueError(f"degree.max ({max_v}) cannot be less than degree.min ({min_v})")
 
     if dist == "fixed":
         if "value" not in param:
             raise ValueError("degree.fixed requires 'value'")
-        return partial(_deg_fixed, value=float(param["value"]),
-                       round_mode=round_mode, min_v=min_v, max_v=max_v)
+        return _DegSampler(DIST_FIXED, float(param["value"]), 0.0, round_code, min_v, max_v)
 
     if dist == "uniform":
         if "low" in param and "high" in param:
@@ -93,23 +126,20 @@ def parse_degree(param: Dict[str, Any]) -> Callable[[np.random.Generator], int]:
             low, high = median - sigma, median + sigma
         if high < low:
             raise ValueError(f"degree.uniform: high ({high}) < low ({low})")
-        return partial(_deg_uniform, low=low, high=high,
-                       round_mode=round_mode, min_v=min_v, max_v=max_v)
+        return _DegSampler(DIST_UNIFORM, low, high, round_code, min_v, max_v)
 
     if dist == "normal":
         mean = float(param.get("mean", 1.0))
         sigma = float(param.get("sigma", 1.0))
         if sigma < 0:
             raise ValueError("degree.normal sigma must be >= 0")
-        return partial(_deg_normal, mean=mean, sigma=sigma,
-                       round_mode=round_mode, min_v=min_v, max_v=max_v)
+        return _DegSampler(DIST_NORMAL, mean, sigma, round_code, min_v, max_v)
 
     if dist == "poisson":
         lam = float(param.get("lam", param.get("lambda", 1.0)))
         if lam < 0:
             raise ValueError("degree.poisson lam must be >= 0")
-        return partial(_deg_poisson, lam=lam,
-                       round_mode=round_mode, min_v=min_v, max_v=max_v)
+        return _DegSampler(DIST_POISSON, lam, 0.0, round_code, min_v, max_v)
 
     if dist == "lognormal":
         sigma = float(param.get("sigma", 1.0))
@@ -120,8 +150,7 @@ def parse_degree(param: Dict[str, Any]) -> Callable[[np.random.Generator], int]:
         else:
             median = float(param.get("median", 1.0))
             meanlog = np.log(max(median, 1e-12))
-        return partial(_deg_lognormal, meanlog=meanlog, sigma=sigma,
-                       round_mode=round_mode, min_v=min_v, max_v=max_v)
+        return _DegSampler(DIST_LOGNORMAL, meanlog, sigma, round_code, min_v, max_v)
 
     raise ValueError(f"Unsupported degree.dist '{dist}'")
 
@@ -131,13 +160,14 @@ def parse_connections_config(conn_config, full_config, parent, invert_direction)
     if len(conn_config) == 0:
         raise ValueError(f"Connections cannot be empty, either make it null or add a connection")
     eprops = {}
+    alter_nodes = full_config.get("AlterNodes") or {}
     for name, props in conn_config.items():
         conn_props = props.get("properties")
         validate_aerospike_properties(conn_props)
-        if not isinstance(props.get("degree"), Dict):
-            raise TypeError("degree is not a dict for {name}")
+        if not isinstance(props.get("degree"), dict):
+            raise TypeError(f"degree is not a dict for {name}")
         props["degree"] = parse_degree(props.get("degree"))
-        if name not in full_config and name not in full_config.get("AlterNodes"):
+        if name not in full_config and name not in alter_nodes:
             raise ValueError(f"Connection type '{name}' not found as a node type")
         label = props.get("label")
         if label:
@@ -1,20 +1,24 @@
 import os
 import string
 from typing import Dict, Tuple, Any, List, Optional
-from collections import defaultdict
-import csv
 import pickle
+import numpy as np
+from multiprocessing import shared_memory
 
 BATCH_SIZE = 1_000_000
 MAX_EDGE_FILE_LINES = 20_000_000
 CSV_BUFFER_SIZE = 8 *1024 * 1024
+CSV_EOL = "\r\n"  # csv.writer's default line terminator
 _AUX_CACHE = None
 
-def _get_aux(aux_path):
+def _get_aux(aux_shm_name):
     global _AUX_CACHE
     if _AUX_CACHE is None:
-        with open(aux_path, "rb") as f:
-            _AUX_CACHE = pickle.load(f)
+        shm = shared_memory.SharedMemory(name=aux_shm_name)
+        try:
+            _AUX_CACHE = pickle.loads(shm.buf)
+        finally:
+            shm.close()
     return _AUX_CACHE
 
 
@@ -32,6 +36,38 @@ def generate_line_properties(schema):
 
     return values
 
+def _csv_field(v: Any) -> str:
+    """Format one value the way csv.writer does with QUOTE_MINIMAL."""
+    t = type(v)
+    if t is int or t is float or t is bool:
+        return str(v)
+    if v is None:
+        return ""
+    s = v if t is str else str(v)
+    if '"' in s:
+        return '"' + s.replace('"', '""') + '"'
+    if "," in s or "\n" in s or "\r" in s:
+        return '"' + s + '"'
+    return s
+
+
+def format_line_properties(values: List[Any]) -> str:
+    """Returns generated property values as the comma-prefixed tail of a CSV line"""
+    return "".join(["," + _csv_field(v) for v in values])
+
+
+def generate_line_properties_batch(schema, count: int) -> List[str]:
+    """Returns count formatted property tails, drawing each property's values in one batch"""
+    if not schema:
+        return [""] * count
+    columns = [[_csv_field(v) for v in props.get("generator").batch(count)] for props in schema.values()]
+    return ["," + ",".join(row) for row in zip(*columns)]
+
+
+def _csv_line(fields: List[Any]) -> str:
+    return ",".join([_csv_field(v) for v in fields]) + CSV_EOL
+
+
 def get_property_header_list(props: dict) -> list:
     """Returns properties header"""
     prop_list = []
@@ -52,13 +88,14 @@ def _edge_label(src_type: str, dst_type: str, conn_meta: Dict[str, Any], invert_
         return conn_meta.get("label") or conn_meta.get("type") or f"REL_{src_type.upper()}_TO_{dst_type.upper()}"
 
 
-def _sample_degree(meta: Dict[str, Any], rng_np) -> int:
-    if not meta:
-        return 0
-    deg = meta.get("degree")
-    if callable(deg):
+def _sample_degree(meta: Dict[str, Any], rng_np, size: Optional[int] = None):
+    """Draw one degree, or an int64 array of 'size' degrees in a single vectorized call."""
+    deg = meta.get("degree") if meta else None
+    if not callable(deg):
+        return 0 if size is None else np.zeros(size, dtype=np.int64)
+    if size is None:
         return int(deg(rng_np))
-    return 0
+    return deg(rng_np, size=size)
 
 
 def _shard_root(base: str, worker_id: int, total_disks: int, out_dir: Optional[str]) -> str:
@@ -72,27 +109,25 @@ def _open_vertex_writer(root: str, label: str, props: Dict[str, Any], wid: int):
     path = os.path.join(root, label)
     os.makedirs(path, exist_ok=True)
     f = open(os.path.join(path, f"vertices_part_{wid}_{label}_000.csv"),
-             "w", newline="", buffering=CSV_BUFFER_SIZE)
-    w = csv.writer(f)
+             "wb", buffering=CSV_BUFFER_SIZE)
     header = ["~id", "~label"] + get_property_header_list(props)
-    w.writerow(header)
-    return {"file": f, "writer": w, "buf": [], "lines": 0, "index": 0, "subdir": path, "type" : "vertices", "header": header}
+    f.write(_csv_line(header).encode())
+    return {"file": f, "buf": [], "lines": 0, "index": 0, "subdir": path, "type" : "vertices", "header": header}
 
 
 def _open_edge_writer(root: str, elabel: str, props: Dict[str, Any], wid: int):
     path = os.path.join(root, elabel)
     os.makedirs(path, exist_ok=True)
     f = open(os.path.join(path, f"edges_part_{wid}_{elabel}_000.csv"),
-             "w", newline="", buffering=CSV_BUFFER_SIZE)
-    w = csv.writer(f)
+             "wb", buffering=CSV_BUFFER_SIZE)
     header = ["~from", "~to", "~label"] + get_property_header_list(props)
-    w.writerow(header)
-    return {"file": f, "writer": w, "buf": [], "lines": 0, "index": 0, "subdir": path, "type" : "edges", "header": header}
+    f.write(_csv_line(header).encode())
+    return {"file": f, "buf": [], "lines": 0, "index": 0, "subdir": path, "type" : "edges", "header": header}
 
 
 def process_full_worker(
         worker_id: int,
-        aux_path: str,
+        aux_shm_name: str,
         num_workers: int,
         ego_start: int,
         ego_count: int,
@@ -101,12 +136,11 @@ def process_full_worker(
         seed: int,
         total_disks: int,
         out_dir: str | None = None) -> tuple[int, int]:
-    payload = _get_aux(aux_path)
+    payload = _get_aux(aux_shm_name)
     config_flatmap = payload["config"]
     vertex_properties = payload["vertex_properties"]
     edge_properties = payload["edge_properties"]
     ego_label = config_flatmap["EgoNode"]["label"]
-    rng_np = seed
 
     vroot = _shard_root("vertices", worker_id, total_disks, out_dir)
     eroot = _shard_root("edges", worker_id, total_disks, out_dir)
@@ -129,18 +163,26 @@ def process_full_worker(
                 edge_writers[label] = _open_edge_writer(eroot, label, edge_properties.get(label), worker_id)
         return edge_writers.get(label)
 
-    def ew_buff_write(buff: List[Any], origin: str, nbr: str, label: str, props: List[Any]) -> None:
+    def ew_buff_write(buff: List[str], origin: str, nbr: str, label: str, props: str) -> None:
+        # ids and labels never need quoting; props is an already formatted property tail
         if invert_direction:
-            buff.append([nbr, origin, label] + props)
+            buff.append(f"{nbr},{origin},{label}{props}{CSV_EOL}")
         else:
-            buff.append([origin, nbr, label] + props)
+            buff.append(f"{origin},{nbr},{label}{props}{CSV_EOL}")
 
-    counters = defaultdict(int)
+    # next id number per label; this worker owns ids worker_id, worker_id + num_workers, ...
+    id_cursors: Dict[str, int] = {}
 
     def next_id(label: str) -> str:
-        idx = generate_vertex_id(label, counters[label] + worker_id)
-        counters[label] += num_workers
-        return idx
+        n = id_cursors.get(label, worker_id)
+        id_cursors[label] = n + num_workers
+        return generate_vertex_id(label, n)
+
+    def next_ids(label: str, count: int) -> List[str]:
+        n = id_cursors.get(label, worker_id)
+        end = n + count * num_workers
+        id_cursors[label] = end
+        return [generate_vertex_id(label, i) for i in range(n, end, num_workers)]
 
     def _maybe_rollover(writer, worker_id):
         if writer["lines"] >= MAX_EDGE_FILE_LINES:
@@ -148,17 +190,15 @@ def process_full_worker(
             writer["index"] += 1
             fname = f"{writer['type']}_part_{worker_id}_{os.path.basename(writer['subdir'])}_{writer['index']:03d}.csv"
             fpath = os.path.join(writer["subdir"], fname)
-            f = open(fpath, "w", newline="", buffering=CSV_BUFFER_SIZE)
-            w = csv.writer(f)
-            w.writerow(writer["header"])
+            f = open(fpath, "wb", buffering=CSV_BUFFER_SIZE)
+            f.write(_csv_line(writer["header"]).encode())
             writer["file"] = f
-            writer["writer"] = w
             writer["lines"] = 0
 
     def _flush_writer(writer, worker_id, force=False):
         buf = writer.get("buf")
         if force or len(buf) >= BATCH_SIZE:
-            writer["writer"].writerows(buf)
+            writer["file"].write("".join(buf).encode())
             writer["lines"] += len(buf)
             buf.clear()
             writer["file"].flush()
@@ -169,6 +209,9 @@ def process_full_worker(
     p_share = node_share_chance / 100.0
 
     for _ego_idx in range(ego_start, ego_start + ego_count):
+        # Counter-based stream keyed on (seed, ego index): an ego's draws do not
+        # depend on which chunk or worker generates it.
+        rng_np = np.random.Generator(np.random.Philox(key=[seed, _ego_idx]))
         ego_props = vertex_properties[ego_label]
         ego_conns = config_flatmap["EgoNode"].get("connections")
 
@@ -184,7 +227,7 @@ def process_full_worker(
                 d1_plan.append((dst_type, elabel, count, meta))
 
         ego_id = next_id(ego_label)
-        vw(ego_label)["buf"].append([ego_id, ego_label] + generate_line_properties(ego_props))
+        vw(ego_label)["buf"].append(f"{ego_id},{ego_label}{format_line_properties(generate_line_properties(ego_props))}{CSV_EOL}")
         vertices_written+=1
 
         for dst_type, elabel, cnt, _meta in d1_plan:
@@ -198,24 +241,30 @@ def process_full_worker(
             e_writer = ew(elabel)
             e_buf = e_writer["buf"]
             elabel_props = edge_properties[elabel]
-
-            for _ in range(cnt):
-                d2_plan: List[Tuple[str, str, Dict, int]] = []
-                if dst_conns:
-                    for d2_type, d2_meta in dst_conns.items():
-                        if d2_type == "EgoNode" or d2_type == ego_label or d2_type not in vertex_properties:
-                            continue
-                        k = _sample_degree(d2_meta, rng_np)
-                        if k <= 0:
-                            continue
-                        d2_elabel = _edge_label(dst_type, d2_type, d2_meta, invert_direction)
-                        d2_plan.append((d2_type, d2_elabel, d2_meta, k))
-                        vertices_written += 1
-
-                nbr_id = next_id(dst_label)
-                dst_buf.append([nbr_id, dst_label] + generate_line_properties(dst_props))
-
-                ew_buff_write(e_buf, ego_id, nbr_id, elabel, generate_line_properties(elabel_props))
+            dst_prop_rows = generate_line_properties_batch(dst_props, cnt)
+            e_prop_rows = generate_line_properties_batch(elabel_props, cnt)
+            nbr_ids = next_ids(dst_label, cnt)
+
+            # Leaf degrees for all cnt alters are drawn with one rng call per leaf type
+            d2_degrees: List[Tuple[str, str, Dict, np.ndarray]] = []
+            if dst_conns:
+                for d2_type, d2_meta in dst_conns.items():
+                    if d2_type == "EgoNode" or d2_type == ego_label or d2_type not in vertex_properties:
+                        continue
+                    d2_elabel = _edge_label(dst_type, d2_type, d2_meta, invert_direction)
+                    d2_degrees.append((d2_type, d2_elabel, d2_meta, _sample_degree(d2_meta, rng_np, size=cnt).tolist()))
+
+            for alter_idx in range(cnt):
+                d2_plan: List[Tuple[str, str, Dict, int]] = [
+                    (d2_type, d2_elabel, d2_meta, degs[alter_idx])
+                    for d2_type, d2_elabel, d2_meta, degs in d2_degrees
+                    if degs[alter_idx] > 0
+                ]
+
+                nbr_id = nbr_ids[alter_idx]
+                dst_buf.append(f"{nbr_id},{dst_label}{dst_prop_rows[alter_idx]}{CSV_EOL}")
+
+                ew_buff_write(e_buf, ego_id, nbr_id, elabel, e_prop_rows[alter_idx])
 
                 vertices_written += 1
                 edges_written += 1
@@ -236,11 +285,14 @@ def process_full_worker(
                     share_writer  = ew(share_label, d2_edge_props)
                     share_buf = share_writer["buf"]
 
-                    for _ in range(k):
-                        leaf_id = next_id(leaf_label)
-                        leaf_buf.append([leaf_id, leaf_label] + generate_line_properties(leaf_props))
+                    leaf_prop_rows = generate_line_properties_batch(leaf_props, k)
+                    d2_prop_rows = generate_line_properties_batch(d2_edge_props, k)
+                    leaf_ids = next_ids(leaf_label, k)
+                    for leaf_idx in range(k):
+                        leaf_id = leaf_ids[leaf_idx]
+                        leaf_buf.append(f"{leaf_id},{leaf_label}{leaf_prop_rows[leaf_idx]}{CSV_EOL}")
 
-                        edge_props = generate_line_properties(d2_edge_props)
+                        edge_props = d2_prop_rows[leaf_idx]
                         ew_buff_write(d2_buf, nbr_id, leaf_id, d2_elabel, edge_props)
 
                         vertices_written += 1
@@ -17,10 +17,9 @@ Usage:
 import argparse
 import os
 import pickle
-import tempfile
 
 import numpy as np
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import multiprocessing
 from multiprocessing import shared_memory
 import time
@@ -48,10 +47,11 @@ def cleanup():
     if shared_mem is not None:
         try:
             print("Cleaning up shared memory...", file=sys.stderr)
-            shared_mem.close()
             shared_mem.unlink()
+            shared_mem.close()
         except Exception:
             pass
+        shared_mem = None
 
 def signal_handler(signum, frame):
     """Handle interrupt signals."""
@@ -97,10 +97,18 @@ def sample_log_normal_deg(N, median, sigma, rng):
     degs = rng.lognormal(mean=mu, sigma=sigma, size=N)
     return degs.astype(int)
 
+ZIPF_TABLE_MAX = 1 << 20
+
+
 def sample_sequence_powerlaw(n, gamma, seed=None):
     """
     Sample `n` integer degrees from a discrete power-law (Zipf) distribution:
       P(k) ∝ k⁻ᵞ  for k = 1,2,3,…
+    capped at n-1 (the same law as np.minimum(rng.zipf(gamma), n-1)).
+
+    Degrees come from a vectorized inverse CDF: one uniform draw per vertex is located in the
+    cumulative k⁻ᵞ table with np.searchsorted. The table stops at ZIPF_TABLE_MAX; the rare draws
+    past it use the continuity-corrected Pareto tail, whose relative error there is O(k⁻²).
 
     Args:
         n      (int):   number of samples (vertices)
@@ -110,12 +118,29 @@ def sample_sequence_powerlaw(n, gamma, seed=None):
     Returns:
         np.ndarray of shape (n,), dtype=int
     """
+    if gamma <= 1:
+        raise ValueError(f"gamma must be > 1, got {gamma}")
     rng = np.random.default_rng(seed)
-    # Raw Zipf samples (values ≥1), heavy tail
-    degs = rng.zipf(gamma, size=n)
     # Cap at n–1 so we never exceed the number of other vertices
     max_possible = n - 1
-    degs = np.minimum(degs, max_possible)
+    if max_possible < 1:
+        return np.zeros(n, dtype=np.int64)
+
+    m = min(max_possible, ZIPF_TABLE_MAX)
+    weights = np.arange(1, m + 1, dtype=np.float64) ** -gamma
+    # zeta(gamma): table sum plus the Euler-Maclaurin estimate of the sum past m
+    zeta = weights.sum() + m ** (1 - gamma) / (gamma - 1) - m ** -gamma / 2 + gamma * m ** (-gamma - 1) / 12
+    cdf = np.cumsum(weights)
+    cdf /= zeta
+
+    u = rng.random(n)
+    degs = np.searchsorted(cdf, u, side="right") + 1
+    beyond = degs > m
+    if beyond.any():
+        tail = ((1.0 - u[beyond]) * (zeta * (gamma - 1))) ** (-1.0 / (gamma - 1)) + 0.5
+        np.minimum(tail, max_possible, out=tail)
+        degs[beyond] = np.floor(tail)
+    np.minimum(degs, max_possible, out=degs)
     return degs
 
 def print_degree_distribution(deg_seq: np.ndarray, distribution: str = "lognormal", num_bins: int = 20):
@@ -173,18 +198,6 @@ def sample_targets(n, u, k, rng):
             targets.add(v)
     return list(targets)
 
-def dump_pickle(obj, path=None):
-    """
-    Serialize object to disk using pickle.
-    If no path use a secure temp file and return its path.
-    """
-    if path is None:
-        fd, path = tempfile.mkstemp(suffix=".pkl", prefix="aux_payload_")
-        os.close(fd)  # We just want the name, will open with pickle
-    with open(path, "wb") as f:
-        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
-    return path
-
 def main():
     global shared_mem, executor
     
@@ -240,23 +253,23 @@ def main():
 
         edge_configs = validator.parse_edge_config(config.get('edges', {}), vertex_idx_mapping)
 
-        # Sparse COO tensor: (src_global_id, edge_type_index, degree)
-        degree_records = []
-        rng = np.random.default_rng(1234)
+        # Dense (vertex, edge_type) out-degree tensor, each edge type filled by one slice assignment.
+        # It lives in shared memory from the start so workers map it without a second copy.
+        tensor_shape = (nodes, len(edge_configs))
+        tensor_dtype = np.dtype(np.int32)
+        shared_mem = shared_memory.SharedMemory(
+            create=True, size=max(1, tensor_shape[0] * tensor_shape[1] * tensor_dtype.itemsize))
+        degree_tensor = np.ndarray(tensor_shape, dtype=tensor_dtype, buffer=shared_mem.buf)
+        degree_tensor.fill(0)
         for E in edge_configs:
             src_type = E.from_type_idx
             start, end = vertex_ranges[src_type], vertex_ranges[src_type+1]
             N_src = end - start
-            degs = sample_sequence_powerlaw(
+            degree_tensor[start:end, E.index] = sample_sequence_powerlaw(
                 N_src,
                 gamma=args.gamma,
                 seed=args.seed
             )
-            for i, d in enumerate(degs):
-                degree_records.append((start + i, E.index, d))
-        degree_tensor = np.zeros((nodes, len(edge_configs)), dtype=np.int32)
-        for u, eidx, d in degree_records:
-            degree_tensor[u, eidx] = d
 
         # 6. Build target pools for each vertex type
         target_pools = []
@@ -288,19 +301,14 @@ def main():
             os.makedirs(args.out_dir, exist_ok=True)
             print(f"\nOutput directory: {args.out_dir}")
 
-        # Setup shared memory for degree sequence
-        tensor_bytes = degree_tensor.nbytes
-        deg_shm = shared_memory.SharedMemory(create=True, size=tensor_bytes)
-        np.ndarray(degree_tensor.shape, degree_tensor.dtype, deg_shm.buf)[:] = degree_tensor
-
-        # Pickle useful data
+        # Pickle useful data once; workers receive the bytes with their task instead of reading a temp file
         aux_payload = {
             "vertex_ranges": vertex_ranges,
             "edge_configs": edge_configs,
             "vertice_configs": vertice_configs,
             "vertex_idx_mapping": vertex_idx_mapping
         }
-        aux_path = dump_pickle(aux_payload)
+        aux_bytes = pickle.dumps(aux_payload, protocol=pickle.HIGHEST_PROTOCOL)
 
         # Optimize worker count
         cpu_count = multiprocessing.cpu_count()
@@ -323,10 +331,10 @@ def main():
                 executor.submit(
                     gen.process_full_worker,
                     wid,
-                    deg_shm.name,
-                    degree_tensor.shape,
-                    degree_tensor.dtype.name,
-                    aux_path,
+                    shared_mem.name,
+                    tensor_shape,
+                    tensor_dtype.name,
+                    aux_bytes,
                     args.seed, args.nodes,
                     len(available_disks) if available_disks else workers,
                     workers,
@@ -335,11 +343,19 @@ def main():
                 for wid in range(workers)
             ]
             
+            # Report workers as they finish; on the first failure cancel whatever has not started
             completed = 0
-            for f in futures:
-                f.result()
-                completed += 1
-                print(f"\nProgress: {completed}/{workers} workers completed ({(completed/workers)*100:.1f}%)")
+            try:
+                for f in as_completed(futures):
+                    f.result()
+                    completed += 1
+                    print(f"\nProgress: {completed}/{workers} workers completed ({(completed/workers)*100:.1f}%)")
+            except Exception:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        total_edges = int(degree_tensor.sum())
+        del degree_tensor  # drop the view before the shared block is closed
 
         # Normal cleanup
         executor = None
@@ -348,7 +364,6 @@ def main():
             shared_mem.unlink()
         shared_mem = None
 
-        total_edges = np.sum(degree_tensor)
         total_size, files_count = get_total_file_size(available_disks, args.out_dir)
         
         print(f'\n✔ Generated graph with {args.nodes:,} vertices and {total_edges:,} edges')
@@ -135,14 +135,14 @@ def process_full_worker(
         shm_name: str,
         shm_shape: tuple[int, int],
         shm_dtype: str,
-        aux_path: str,
+        aux_bytes: bytes,
         seed: int,
         total_nodes: int,
         total_disks: int,
         total_workers: int,
         out_dir: str | None = None) -> None:
     # Get shared memory array
-    payload = pickle.load(open(aux_path, "rb"))
+    payload = pickle.loads(aux_bytes)
     vertex_ranges = payload["vertex_ranges"]
     vertice_configs = payload["vertice_configs"]
     edge_configs = payload["edge_configs"]
@@ -1,17 +1,39 @@
-import subprocess
 from tqdm import tqdm
 import argparse
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import time
+from google.cloud import storage
 
-def upload_file(path: Path, gcs_path: str):
-    subprocess.run(["gsutil", "-q", "cp", str(path), gcs_path], check=True)
+UPLOAD_TIMEOUT = 300
 
-def upload_worker(file: Path, gcs_base: str):
+# One client shared by all upload threads, so every upload reuses the same
+# authenticated HTTP session instead of spawning a gsutil process per file.
+_client = None
+
+def get_client() -> storage.Client:
+    global _client
+    if _client is None:
+        _client = storage.Client()
+    return _client
+
+def split_gcs_path(gcs_path: str):
+    """Split gs://bucket/prefix into (bucket, prefix)."""
+    if not gcs_path.startswith("gs://"):
+        raise ValueError(f"GCS path must start with gs://, got {gcs_path}")
+    bucket, _, prefix = gcs_path[len("gs://"):].partition("/")
+    return bucket, prefix.strip("/")
+
+def upload_file(path: Path, bucket: storage.Bucket, blob_name: str):
+    # Library defaults: resumable upload above 8 MiB in 100 MiB chunks, and a CRC32C check of every upload
+    blob = bucket.blob(blob_name)
+    blob.upload_from_filename(str(path), timeout=UPLOAD_TIMEOUT)
+
+def upload_worker(file: Path, bucket: storage.Bucket, prefix: str):
     # Put vertices and edges in separate subdirectories
     subdir = "vertices" if "vertices" in str(file) else "edges"
-    upload_file(file, f"{gcs_base}/{subdir}/{file.name}")
+    blob_name = f"{prefix}/{subdir}/{file.name}" if prefix else f"{subdir}/{file.name}"
+    upload_file(file, bucket, blob_name)
     print(f"✔ Uploaded: {subdir}/{file.name}")
 
 def get_files_from_disk(disk_num: int, file_type: str) -> list:
@@ -47,10 +69,13 @@ def main():
     print(f"   • {len(edge_files)} edge files")
     print(f"   • {total_files} total files")
 
+    bucket_name, prefix = split_gcs_path(args.gcs)
+    bucket = get_client().bucket(bucket_name)
+
     # Upload all files
     with ThreadPoolExecutor(max_workers=args.threads) as executor:
         futures = {
-            executor.submit(upload_worker, f, args.gcs): f
+            executor.submit(upload_worker, f, bucket, prefix): f
             for f in vertex_files + edge_files
         }
         for _ in tqdm(as_completed(futures), total=len(futures), desc="Uploading"):